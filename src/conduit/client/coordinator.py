@@ -5,7 +5,8 @@ the session focused on protocol logic rather than message processing.
 """
 
 import asyncio
-import uuid
+import itertools
+import sys
 from collections.abc import Coroutine
 from typing import Any, Awaitable, Callable, TypeVar
 
@@ -21,12 +22,13 @@ from conduit.protocol.base import (
 from conduit.protocol.common import CancelledNotification
 from conduit.protocol.initialization import InitializeRequest
 from conduit.protocol.jsonrpc import (
-    JSONRPCError,
-    JSONRPCNotification,
-    JSONRPCRequest,
-    JSONRPCResponse,
+    encode_error,
+    encode_notification,
+    encode_request,
+    encode_response,
 )
 from conduit.shared.message_parser import MessageParser
+from conduit.shared.request_timeout import expire_request
 from conduit.transport.client_v2 import ClientTransport, ServerMessage
 
 TRequest = TypeVar("TRequest", bound=Request)
@@ -52,6 +54,7 @@ class MessageCoordinator:
         self._request_handlers: dict[str, RequestHandler] = {}
         self._notification_handlers: dict[str, NotificationHandler] = {}
         self._message_loop_task: asyncio.Task[None] | None = None
+        self._next_request_id = itertools.count(1)
 
     # ================================
     # Lifecycle
@@ -145,11 +148,12 @@ class MessageCoordinator:
         payload = server_message.payload
         server_id = server_message.server_id
 
-        if self.parser.is_valid_request(payload):
+        kind = self.parser.classify(payload)
+        if kind == "request":
             await self._handle_request(server_id, payload)
-        elif self.parser.is_valid_notification(payload):
+        elif kind == "notification":
             await self._handle_notification(server_id, payload)
-        elif self.parser.is_valid_response(payload):
+        elif kind == "response":
             await self._handle_response(server_id, payload)
         else:
             print(f"Unknown message type from {server_id}: {payload}")
@@ -212,11 +216,11 @@ class MessageCoordinator:
             result_or_error = await handler(server_id, request)
 
             if isinstance(result_or_error, Error):
-                response = JSONRPCError.from_error(result_or_error, request_id)
+                response = encode_error(result_or_error, request_id)
             else:
-                response = JSONRPCResponse.from_result(result_or_error, request_id)
+                response = encode_response(result_or_error, request_id)
 
-            await self.transport.send(server_id, response.to_wire())
+            await self.transport.send(server_id, response)
 
         except Exception:
             error = Error(
@@ -326,17 +330,21 @@ class MessageCoordinator:
         if not self.running:
             raise RuntimeError("Cannot send request: coordinator is not running")
 
-        request_id = str(uuid.uuid4())
-        jsonrpc_request = JSONRPCRequest.from_request(request, request_id)
-        future: asyncio.Future[Result | Error] = asyncio.Future()
+        request_id = next(self._next_request_id)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Result | Error] = loop.create_future()
 
         self.server_manager.track_request_to_server(
             server_id, request_id, request, future
         )
 
         try:
-            await self.transport.send(server_id, jsonrpc_request.to_wire())
-            return await asyncio.wait_for(future, timeout)
+            await self.transport.send(server_id, encode_request(request, request_id))
+            timer = loop.call_later(timeout, expire_request, future)
+            try:
+                return await future
+            finally:
+                timer.cancel()
         except asyncio.TimeoutError:
             await self._handle_request_timeout(server_id, request_id, request)
             raise
@@ -344,7 +352,7 @@ class MessageCoordinator:
             self.server_manager.untrack_request_to_server(server_id, request_id)
 
     async def _handle_request_timeout(
-        self, server_id: str, request_id: str, request: Request
+        self, server_id: str, request_id: str | int, request: Request
     ) -> None:
         """Sends a cancellation notification to a server.
 
@@ -376,8 +384,7 @@ class MessageCoordinator:
         if not self.running:
             raise RuntimeError("Cannot send notification: coordinator is not running")
 
-        jsonrpc_notification = JSONRPCNotification.from_notification(notification)
-        await self.transport.send(server_id, jsonrpc_notification.to_wire())
+        await self.transport.send(server_id, encode_notification(notification))
 
     # ================================
     # Register handlers
@@ -385,13 +392,13 @@ class MessageCoordinator:
 
     def register_request_handler(self, method: str, handler: RequestHandler) -> None:
         """Register a request handler."""
-        self._request_handlers[method] = handler
+        self._request_handlers[sys.intern(method)] = handler
 
     def register_notification_handler(
         self, method: str, handler: NotificationHandler
     ) -> None:
         """Register a notification handler."""
-        self._notification_handlers[method] = handler
+        self._notification_handlers[sys.intern(method)] = handler
 
     # ================================
     # Helpers
@@ -400,5 +407,4 @@ class MessageCoordinator:
         self, server_id: str, request_id: str | int, error: Error
     ) -> None:
         """Send error response to server."""
-        response = JSONRPCError.from_error(error, request_id)
-        await self.transport.send(server_id, response.to_wire())
+        await self.transport.send(server_id, encode_error(error, request_id))
@@ -115,7 +115,7 @@ class ServerManager:
     def track_request_to_server(
         self,
         server_id: str,
-        request_id: str,
+        request_id: str | int,
         request: Request,
         future: asyncio.Future[Result | Error],
     ) -> None:
@@ -137,7 +137,7 @@ class ServerManager:
         server_state.requests_to_server[request_id] = (request, future)
 
     def untrack_request_to_server(
-        self, server_id: str, request_id: str
+        self, server_id: str, request_id: str | int
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Stop tracking a request to the server.
 
@@ -158,7 +158,7 @@ class ServerManager:
         return server_state.requests_to_server.pop(request_id, None)
 
     def get_request_to_server(
-        self, server_id: str, request_id: str
+        self, server_id: str, request_id: str | int
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Get a pending request to the server.
 
@@ -179,7 +179,7 @@ class ServerManager:
         return server_state.requests_to_server.get(request_id, None)
 
     def resolve_request_to_server(
-        self, server_id: str, request_id: str, result_or_error: Result | Error
+        self, server_id: str, request_id: str | int, result_or_error: Result | Error
     ) -> None:
         """Resolve a pending request to the server.
 
@@ -18,6 +18,7 @@ Most applications build on these primitives rather than using them directly,
 but understanding this foundation helps when debugging and contributing.
 """
 
+import functools
 import traceback
 from typing import Annotated, Any, Literal, Self
 
@@ -39,11 +40,51 @@ Role = Annotated[
 
 
 class ProtocolModel(BaseModel):
+    # Validators are built on first use rather than at import, so a process
+    # only pays for the message types it actually handles.
     model_config = ConfigDict(
-        extra="allow", validate_by_alias=True, validate_by_name=True
+        extra="allow",
+        validate_by_alias=True,
+        validate_by_name=True,
+        defer_build=True,
     )
 
 
+@functools.cache
+def wire_keys(
+    model_class: type[BaseModel], skip: frozenset[str]
+) -> tuple[tuple[str, str], ...]:
+    """Map each field of a model to the key it uses on the wire.
+
+    Cached per class, so from_protocol doesn't walk model_fields and resolve
+    aliases on every message.
+
+    Args:
+        model_class: Model whose fields to map.
+        skip: Field names handled separately by the caller.
+
+    Returns:
+        (field_name, wire_key) pairs, where wire_key is the alias if set.
+    """
+    return tuple(
+        (field_name, field_info.alias or field_name)
+        for field_name, field_info in model_class.model_fields.items()
+        if field_name not in skip
+    )
+
+
+# Fields that live in the message envelope (method, `_meta`) rather than in
+# params or the result body. from_protocol and to_protocol map them by hand.
+REQUEST_ENVELOPE_FIELDS = frozenset({"method", "progress_token", "metadata"})
+RESULT_ENVELOPE_FIELDS = frozenset({"metadata"})
+NOTIFICATION_ENVELOPE_FIELDS = frozenset({"method", "metadata"})
+
+# model_dump wants a plain set. Built once rather than per call; it's only read.
+_REQUEST_DUMP_EXCLUDE = set(REQUEST_ENVELOPE_FIELDS)
+_RESULT_DUMP_EXCLUDE = set(RESULT_ENVELOPE_FIELDS)
+_NOTIFICATION_DUMP_EXCLUDE = set(NOTIFICATION_ENVELOPE_FIELDS)
+
+
 class Request(ProtocolModel):
     """
     Foundation for all MCP request messages.
@@ -148,11 +189,7 @@ class Request(ProtocolModel):
                 kwargs["metadata"] = general_meta
 
         # Add subclass-specific fields, respecting aliases
-        for field_name, field_info in cls.model_fields.items():
-            if field_name in {"method", "progress_token", "metadata"}:
-                continue
-
-            param_key = field_info.alias if field_info.alias else field_name
+        for field_name, param_key in wire_keys(cls, REQUEST_ENVELOPE_FIELDS):
             if param_key in params:
                 kwargs[field_name] = params[param_key]
 
@@ -172,7 +209,7 @@ class Request(ProtocolModel):
             An MCP-compatible request dictionary with method and params
         """
         params = self.model_dump(
-            exclude={"method", "progress_token", "metadata"},
+            exclude=_REQUEST_DUMP_EXCLUDE,
             by_alias=True,
             exclude_none=True,
             mode="json",
@@ -277,13 +314,7 @@ class Result(ProtocolModel):
             kwargs["metadata"] = meta
 
         # Add subclass-specific fields, respecting aliases
-        for field_name, field_info in cls.model_fields.items():
-            if field_name == "metadata":
-                continue
-
-            # Use the alias if it exists, otherwise use the field name
-            param_key = field_info.alias if field_info.alias else field_name
-
+        for field_name, param_key in wire_keys(cls, RESULT_ENVELOPE_FIELDS):
             if param_key in result_data:
                 kwargs[field_name] = result_data[param_key]
 
@@ -303,7 +334,7 @@ class Result(ProtocolModel):
             An MCP-compatible result dictionary
         """
         result = self.model_dump(
-            exclude={"metadata"},
+            exclude=_RESULT_DUMP_EXCLUDE,
             by_alias=True,
             exclude_none=True,
             mode="json",
@@ -483,13 +514,7 @@ class Notification(ProtocolModel):
             kwargs["metadata"] = meta
 
         # Add subclass-specific fields, respecting aliases
-        for field_name, field_info in cls.model_fields.items():
-            if field_name == "method":
-                continue
-
-            # Use the alias if it exists, otherwise use the field name
-            param_key = field_info.alias if field_info.alias else field_name
-
+        for field_name, param_key in wire_keys(cls, NOTIFICATION_ENVELOPE_FIELDS):
             if param_key in params:
                 kwargs[field_name] = params[param_key]
 
@@ -509,7 +534,7 @@ class Notification(ProtocolModel):
             An MCP-compatible notification dictionary with method and params
         """
         params = self.model_dump(
-            exclude={"method", "metadata"},
+            exclude=_NOTIFICATION_DUMP_EXCLUDE,
             by_alias=True,
             exclude_none=True,
             mode="json",
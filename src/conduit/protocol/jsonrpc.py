@@ -1,8 +1,10 @@
+import functools
 from typing import Any
 
 from pydantic import Field
 
 from conduit.protocol.base import (
+    NOTIFICATION_ENVELOPE_FIELDS,
     Error,
     Notification,
     ProtocolModel,
@@ -10,10 +12,54 @@ from conduit.protocol.base import (
     RequestId,
     Result,
 )
+from conduit.protocol.common import EmptyResult
 
 JSONRPC_VERSION = "2.0"
 
 
+@functools.cache
+def _carries_no_params(notification_class: type[Notification]) -> bool:
+    """True if the notification type has no fields beyond the envelope."""
+    return notification_class.model_fields.keys() <= NOTIFICATION_ENVELOPE_FIELDS
+
+
+def encode_request(request: Request, id: RequestId) -> dict[str, Any]:
+    """Build the wire format for a request without a JSONRPCRequest wrapper."""
+    protocol_data = request.to_protocol()
+    protocol_data["jsonrpc"] = JSONRPC_VERSION
+    protocol_data["id"] = id
+    return protocol_data
+
+
+def encode_notification(notification: Notification) -> dict[str, Any]:
+    """Build a notification's wire format without a JSONRPCNotification wrapper."""
+    if (
+        _carries_no_params(type(notification))
+        and not notification.metadata
+        and not notification.model_extra
+    ):
+        # e.g. list_changed notifications: the method is the whole message
+        return {"jsonrpc": JSONRPC_VERSION, "method": notification.method}
+
+    protocol_data = notification.to_protocol()
+    protocol_data["jsonrpc"] = JSONRPC_VERSION
+    return protocol_data
+
+
+def encode_response(result: Result, id: RequestId) -> dict[str, Any]:
+    """Build the wire format for a result without a JSONRPCResponse wrapper."""
+    if type(result) is EmptyResult and not result.metadata and not result.model_extra:
+        # Ping replies and bare acks: the body is always empty
+        return {"jsonrpc": JSONRPC_VERSION, "id": id, "result": {}}
+
+    return {"jsonrpc": JSONRPC_VERSION, "id": id, "result": result.to_protocol()}
+
+
+def encode_error(error: Error, id: RequestId) -> dict[str, Any]:
+    """Build the wire format for an error without a JSONRPCError wrapper."""
+    return {"jsonrpc": JSONRPC_VERSION, "id": id, "error": error.to_protocol()}
+
+
 class JSONRPCRequest(ProtocolModel):
     """
     JSON-RPC 2.0 request wrapper for MCP requests.
@@ -43,10 +89,7 @@ class JSONRPCRequest(ProtocolModel):
 
     def to_wire(self) -> dict[str, Any]:
         """Convert to wire format (spec-compliant JSON-RPC 2.0)"""
-        protocol_data = self.request.to_protocol()
-        protocol_data["jsonrpc"] = self.jsonrpc
-        protocol_data["id"] = self.id
-        return protocol_data
+        return encode_request(self.request, self.id)
 
 
 class JSONRPCNotification(ProtocolModel):
@@ -71,9 +114,7 @@ class JSONRPCNotification(ProtocolModel):
 
     def to_wire(self) -> dict[str, Any]:
         """Convert to wire format (spec-compliant JSON-RPC 2.0)"""
-        protocol_data = self.notification.to_protocol()
-        protocol_data["jsonrpc"] = self.jsonrpc
-        return protocol_data
+        return encode_notification(self.notification)
 
 
 class JSONRPCResponse(ProtocolModel):
@@ -105,11 +146,7 @@ class JSONRPCResponse(ProtocolModel):
 
     def to_wire(self) -> dict[str, Any]:
         """Convert to wire format (spec-compliant JSON-RPC 2.0)"""
-        protocol_data: dict[str, Any] = {}
-        protocol_data["result"] = self.result.to_protocol()
-        protocol_data["jsonrpc"] = self.jsonrpc
-        protocol_data["id"] = self.id
-        return protocol_data
+        return encode_response(self.result, self.id)
 
 
 class JSONRPCError(ProtocolModel):
@@ -141,8 +178,4 @@ class JSONRPCError(ProtocolModel):
 
     def to_wire(self) -> dict[str, Any]:
         """Convert to wire format (spec-compliant JSON-RPC 2.0)"""
-        protocol_data: dict[str, Any] = {}
-        protocol_data["error"] = self.error.to_protocol()
-        protocol_data["jsonrpc"] = self.jsonrpc
-        protocol_data["id"] = self.id
-        return protocol_data
+        return encode_error(self.error, self.id)
@@ -35,9 +35,20 @@ from typing import Any, Literal
 
 from pydantic import Field, field_validator
 
-from conduit.protocol.base import ProtocolModel, Request, Result, Role
+from conduit.protocol.base import (
+    REQUEST_ENVELOPE_FIELDS,
+    ProtocolModel,
+    Request,
+    Result,
+    Role,
+    wire_keys,
+)
 from conduit.protocol.content import AudioContent, ImageContent, TextContent
 
+# Fields CreateMessageRequest.from_protocol maps by hand rather than by alias
+_CREATE_MESSAGE_ENVELOPE_FIELDS = REQUEST_ENVELOPE_FIELDS | {"llm_metadata"}
+_CREATE_MESSAGE_DUMP_EXCLUDE = set(_CREATE_MESSAGE_ENVELOPE_FIELDS)
+
 
 class SamplingMessage(ProtocolModel):
     """
@@ -223,11 +234,7 @@ class CreateMessageRequest(Request):
                 kwargs["llm_metadata"] = llm_meta
 
         # Add other fields, respecting aliases
-        for field_name, field_info in cls.model_fields.items():
-            if field_name in {"method", "progress_token", "metadata", "llm_metadata"}:
-                continue
-
-            param_key = field_info.alias if field_info.alias else field_name
+        for field_name, param_key in wire_keys(cls, _CREATE_MESSAGE_ENVELOPE_FIELDS):
             if param_key in params:
                 kwargs[field_name] = params[param_key]
 
@@ -243,7 +250,7 @@ class CreateMessageRequest(Request):
         """
         # Get the base params (excluding our special metadata handling)
         params = self.model_dump(
-            exclude={"method", "progress_token", "metadata", "llm_metadata"},
+            exclude=_CREATE_MESSAGE_DUMP_EXCLUDE,
             by_alias=True,
             exclude_none=True,
             mode="json",
@@ -1,3 +1,6 @@
+from typing import get_args
+
+from conduit.protocol.base import Notification, Request
 from conduit.protocol.common import (
     CancelledNotification,
     EmptyResult,
@@ -67,6 +70,7 @@ ClientRequest = (
     | CompleteRequest
     | SetLevelRequest
 )
+CLIENT_REQUEST_TYPES: tuple[type[Request], ...] = get_args(ClientRequest)
 
 # ----------- Client Notifications -------------
 ClientNotification = (
@@ -75,12 +79,14 @@ ClientNotification = (
     | InitializedNotification
     | RootsListChangedNotification
 )
+CLIENT_NOTIFICATION_TYPES: tuple[type[Notification], ...] = get_args(ClientNotification)
 
 # ----------- Client Results -------------
 ClientResult = EmptyResult | CreateMessageResult | ListRootsResult | ElicitResult
 
 # ----------- Server Requests -------------
 ServerRequest = PingRequest | ListRootsRequest | CreateMessageRequest | ElicitRequest
+SERVER_REQUEST_TYPES: tuple[type[Request], ...] = get_args(ServerRequest)
 
 # ----------- Server Notifications -------------
 ServerNotification = (
@@ -92,6 +98,7 @@ ServerNotification = (
     | ToolListChangedNotification
     | PromptListChangedNotification
 )
+SERVER_NOTIFICATION_TYPES: tuple[type[Notification], ...] = get_args(ServerNotification)
 
 # ----------- Server Results -------------
 ServerResult = (
@@ -122,24 +129,18 @@ JSONRPCMessage = (
 )
 
 
+def _by_method[T: (Request, Notification)](
+    classes: tuple[type[T], ...],
+) -> dict[str, type[T]]:
+    """Key message classes by the default of their `method` literal."""
+    return {cls.model_fields["method"].default: cls for cls in classes}
+
+
 # ------------ Notification registry -------------
 
-CLIENT_SENT_NOTIFICATION_CLASSES = {
-    "notifications/initialized": InitializedNotification,
-    "notifications/cancelled": CancelledNotification,
-    "notifications/progress": ProgressNotification,
-    "notifications/roots/list_changed": RootsListChangedNotification,
-}
+CLIENT_SENT_NOTIFICATION_CLASSES = _by_method(CLIENT_NOTIFICATION_TYPES)
 
-SERVER_SENT_NOTIFICATION_CLASSES = {
-    "notifications/cancelled": CancelledNotification,
-    "notifications/message": LoggingMessageNotification,
-    "notifications/progress": ProgressNotification,
-    "notifications/resources/updated": ResourceUpdatedNotification,
-    "notifications/resources/list_changed": ResourceListChangedNotification,
-    "notifications/tools/list_changed": ToolListChangedNotification,
-    "notifications/prompts/list_changed": PromptListChangedNotification,
-}
+SERVER_SENT_NOTIFICATION_CLASSES = _by_method(SERVER_NOTIFICATION_TYPES)
 
 NOTIFICATION_CLASSES = {
     **CLIENT_SENT_NOTIFICATION_CLASSES,
@@ -148,28 +149,9 @@ NOTIFICATION_CLASSES = {
 
 # ------------ Request registry -------------
 
-CLIENT_SENT_REQUEST_CLASSES = {
-    "initialize": InitializeRequest,
-    "ping": PingRequest,
-    "tools/list": ListToolsRequest,
-    "tools/call": CallToolRequest,
-    "resources/list": ListResourcesRequest,
-    "resources/templates/list": ListResourceTemplatesRequest,
-    "resources/read": ReadResourceRequest,
-    "resources/subscribe": SubscribeRequest,
-    "resources/unsubscribe": UnsubscribeRequest,
-    "prompts/list": ListPromptsRequest,
-    "prompts/get": GetPromptRequest,
-    "completion/complete": CompleteRequest,
-    "logging/setLevel": SetLevelRequest,
-}
+CLIENT_SENT_REQUEST_CLASSES = _by_method(CLIENT_REQUEST_TYPES)
 
-SERVER_SENT_REQUEST_CLASSES = {
-    "ping": PingRequest,
-    "roots/list": ListRootsRequest,
-    "sampling/createMessage": CreateMessageRequest,
-    "elicitation/create": ElicitRequest,
-}
+SERVER_SENT_REQUEST_CLASSES = _by_method(SERVER_REQUEST_TYPES)
 
 REQUEST_CLASSES = {
     **CLIENT_SENT_REQUEST_CLASSES,
@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
 from conduit.protocol.base import INTERNAL_ERROR, Error, Request, Result
@@ -42,6 +44,16 @@ class ClientManager:
         self._clients[client_id] = state
         return state
 
+    def register_if_absent(self, client_id: str) -> ClientState:
+        """Get client state, registering the client first if it's new.
+
+        Unlike register_client, never replaces existing state.
+        """
+        state = self._clients.get(client_id)
+        if state is None:
+            state = self._clients[client_id] = ClientState()
+        return state
+
     def get_client(self, client_id: str) -> ClientState | None:
         """Get client state."""
         return self._clients.get(client_id)
@@ -66,9 +78,7 @@ class ClientManager:
         protocol_version: str,
     ) -> None:
         """Register a client and store its initialization data."""
-        state = self.get_client(client_id)
-        if state is None:
-            state = self.register_client(client_id)
+        state = self.register_if_absent(client_id)
 
         state.capabilities = capabilities
         state.info = client_info
@@ -113,7 +123,7 @@ class ClientManager:
     def track_request_to_client(
         self,
         client_id: str,
-        request_id: str,
+        request_id: str | int,
         request: Request,
         future: asyncio.Future[Result | Error],
     ) -> None:
@@ -135,7 +145,7 @@ class ClientManager:
         state.requests_to_client[request_id] = (request, future)
 
     def untrack_request_to_client(
-        self, client_id: str, request_id: str
+        self, client_id: str, request_id: str | int
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Stop tracking a request to the client.
 
@@ -153,7 +163,7 @@ class ClientManager:
         return state.requests_to_client.pop(request_id, None)
 
     def get_request_to_client(
-        self, client_id: str, request_id: str
+        self, client_id: str, request_id: str | int
     ) -> tuple[Request, asyncio.Future[Result | Error]] | None:
         """Get a pending request without removing it.
 
@@ -171,7 +181,7 @@ class ClientManager:
         return state.requests_to_client.get(request_id)
 
     def resolve_request_to_client(
-        self, client_id: str, request_id: str, result_or_error: Result | Error
+        self, client_id: str, request_id: str | int, result_or_error: Result | Error
     ) -> None:
         """Resolve a pending request with a result or error.
 
@@ -189,18 +199,23 @@ class ClientManager:
             _, future = request_future_tuple
             future.set_result(result_or_error)
 
-    def track_request_from_client(
+    @contextmanager
+    def tracking(
         self,
         client_id: str,
         request_id: str | int,
         request: Request,
         task: asyncio.Task[None],
-    ) -> None:
-        """Track a request from a client.
+    ) -> Iterator[None]:
+        """Track a request from a client for the duration of the block.
+
+        Untracks on exit. If the client is cleaned up in the meantime, its
+        state is already gone and the exit is a harmless no-op.
 
         Args:
             client_id: ID of the client
             request_id: Unique request identifier
+            request: The original request object
             task: The task handling the request
 
         Raises:
@@ -211,6 +226,10 @@ class ClientManager:
             raise ValueError(f"Client {client_id} not registered")
 
         state.requests_from_client[request_id] = (request, task)
+        try:
+            yield
+        finally:
+            state.requests_from_client.pop(request_id, None)
 
     def untrack_request_from_client(
         self, client_id: str, request_id: str | int
@@ -5,7 +5,9 @@ the session focused on protocol logic rather than message processing.
 """
 
 import asyncio
-import uuid
+import itertools
+import logging
+import sys
 from collections.abc import Coroutine
 from typing import Any, Awaitable, Callable, TypeVar
 
@@ -20,15 +22,18 @@ from conduit.protocol.base import (
 )
 from conduit.protocol.common import CancelledNotification
 from conduit.protocol.jsonrpc import (
-    JSONRPCError,
-    JSONRPCNotification,
-    JSONRPCRequest,
-    JSONRPCResponse,
+    encode_error,
+    encode_notification,
+    encode_request,
+    encode_response,
 )
 from conduit.server.client_manager import ClientManager
 from conduit.shared.message_parser import MessageParser
+from conduit.shared.request_timeout import expire_request
 from conduit.transport.server import ClientMessage, ServerTransport
 
+logger = logging.getLogger(__name__)
+
 TRequest = TypeVar("TRequest", bound=Request)
 TResult = TypeVar("TResult", bound=Result)
 TNotification = TypeVar("TNotification", bound=Notification)
@@ -52,6 +57,18 @@ class MessageCoordinator:
         self._request_handlers: dict[str, RequestHandler] = {}
         self._notification_handlers: dict[str, NotificationHandler] = {}
         self._message_loop_task: asyncio.Task[None] | None = None
+        self._next_request_id = itertools.count(1)
+        self._pending_writes: dict[
+            str, list[tuple[dict[str, Any], asyncio.Future[None]]]
+        ] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._route_by_kind: dict[
+            str, Callable[[str, dict[str, Any]], Coroutine[Any, Any, None]]
+        ] = {
+            "request": self._handle_request,
+            "notification": self._handle_notification,
+            "response": self._handle_response,
+        }
 
     # ================================
     # Lifecycle
@@ -94,6 +111,10 @@ class MessageCoordinator:
                 pass
             self._message_loop_task = None
 
+        # Let responses that were already produced reach their clients
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
         self.client_manager.cleanup_all_clients()
 
     # ================================
@@ -108,16 +129,21 @@ class MessageCoordinator:
         the loop, but transport failures will stop message processing entirely.
         """
         try:
-            async for client_message in self.transport.client_messages():
+            # Bind once; both are looked up on every message otherwise
+            route = self._route_client_message
+            client_messages = self.transport.client_messages()
+            async for client_message in client_messages:
                 try:
-                    await self._route_client_message(client_message)
+                    await route(client_message)
                 except Exception as e:
-                    print(
-                        f"Error handling message from {client_message.client_id}: {e}"
+                    logger.warning(
+                        "Error handling message from %s: %s",
+                        client_message.client_id,
+                        e,
                     )
                     continue
         except Exception as e:
-            print(f"Transport error: {e}")
+            logger.error("Transport error: %s", e)
 
     def _on_message_loop_done(self, task: asyncio.Task[None]) -> None:
         """Clean up when message loop task completes.
@@ -143,14 +169,12 @@ class MessageCoordinator:
         payload = client_message.payload
         client_id = client_message.client_id
 
-        if self.parser.is_valid_request(payload):
-            await self._handle_request(client_id, payload)
-        elif self.parser.is_valid_notification(payload):
-            await self._handle_notification(client_id, payload)
-        elif self.parser.is_valid_response(payload):
-            await self._handle_response(client_id, payload)
-        else:
-            print(f"Unknown message type from {client_id}: {payload}")
+        kind = self.parser.classify(payload)
+        if kind is None:
+            logger.warning("Unknown message type from %s: %s", client_id, payload)
+            return
+
+        await self._route_by_kind[kind](client_id, payload)
 
     # ================================
     # Handle requests
@@ -160,7 +184,7 @@ class MessageCoordinator:
         """Handle an incoming request from a client."""
         request_id = payload["id"]
 
-        self._ensure_client_registered(client_id)
+        self.client_manager.register_if_absent(client_id)
 
         request_or_error = self.parser.parse_request(payload)
 
@@ -186,20 +210,11 @@ class MessageCoordinator:
             await self._send_error(client_id, request_id, error)
             return
 
-        task = asyncio.create_task(
+        asyncio.create_task(
             self._execute_request_handler(handler, client_id, request_id, request),
             name=f"handle_{request.method}_{client_id}_{request_id}",
         )
 
-        self.client_manager.track_request_from_client(
-            client_id, request_id, request, task
-        )
-        task.add_done_callback(
-            lambda t: self.client_manager.untrack_request_from_client(
-                client_id, request_id
-            )
-        )
-
     async def _execute_request_handler(
         self,
         handler: RequestHandler,
@@ -207,29 +222,43 @@ class MessageCoordinator:
         request_id: str | int,
         request: Request,
     ) -> None:
-        """Execute handler and send response back to client."""
-        try:
-            result_or_error = await handler(client_id, request)
+        """Execute handler and send response back to client.
 
-            if isinstance(result_or_error, Error):
-                response = JSONRPCError.from_error(result_or_error, request_id)
-            else:
-                response = JSONRPCResponse.from_result(result_or_error, request_id)
+        The request is tracked for as long as the handler runs, so it can be
+        cancelled and is untracked when done without a per-request done callback.
+        Tasks are scheduled in order, so this starts before any cancellation
+        notification that arrives after the request is handled.
+        """
+        if self.client_manager.get_client(client_id) is None:
+            # Client disconnected before the handler got to run
+            return
 
-            await self.transport.send(client_id, response.to_wire())
+        task = asyncio.current_task()
+        assert task is not None  # Always runs as its own task via _route_request
 
-            if isinstance(result_or_error, Error) and self._should_disconnect_for_error(
-                result_or_error
-            ):
-                self.client_manager.cleanup_client(client_id)
+        with self.client_manager.tracking(client_id, request_id, request, task):
+            try:
+                result_or_error = await handler(client_id, request)
 
-        except Exception:
-            error = Error(
-                code=INTERNAL_ERROR,
-                message="Problem handling request",
-                data={"request": request},
-            )
-            await self._send_error(client_id, request_id, error)
+                if isinstance(result_or_error, Error):
+                    response = encode_error(result_or_error, request_id)
+                else:
+                    response = encode_response(result_or_error, request_id)
+
+                await self._queue_write(client_id, response)
+
+                if isinstance(
+                    result_or_error, Error
+                ) and self._should_disconnect_for_error(result_or_error):
+                    self.client_manager.cleanup_client(client_id)
+
+            except Exception:
+                error = Error(
+                    code=INTERNAL_ERROR,
+                    message="Problem handling request",
+                    data={"request": request},
+                )
+                await self._send_error(client_id, request_id, error)
 
     # ================================
     # Handle notifications
@@ -247,7 +276,7 @@ class MessageCoordinator:
 
         handler = self._notification_handlers.get(method)
         if not handler:
-            print(f"Unknown notification '{method}' from {client_id}")
+            logger.warning("Unknown notification '%s' from %s", method, client_id)
             return
 
         asyncio.create_task(
@@ -275,7 +304,7 @@ class MessageCoordinator:
             client_id, request_id
         )
         if not request_future_tuple:
-            print(f"No pending request {request_id} for client {client_id}")
+            logger.warning("No pending request %s for client %s", request_id, client_id)
             return
 
         original_request, future = request_future_tuple
@@ -335,26 +364,32 @@ class MessageCoordinator:
             raise RuntimeError("Cannot send request: coordinator is not running")
 
         # Prepare the request
-        request_id = str(uuid.uuid4())
-        jsonrpc_request = JSONRPCRequest.from_request(request, request_id)
-        future: asyncio.Future[Result | Error] = asyncio.Future()
+        request_id = next(self._next_request_id)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Result | Error] = loop.create_future()
 
         # Set up tracking
-        self._ensure_client_registered(client_id)
+        self.client_manager.register_if_absent(client_id)
         self.client_manager.track_request_to_client(
             client_id, request_id, request, future
         )
 
         try:
-            await self.transport.send(client_id, jsonrpc_request.to_wire())
-            return await asyncio.wait_for(future, timeout)
+            await self.transport.send(client_id, encode_request(request, request_id))
+            timer = loop.call_later(timeout, expire_request, future)
+            try:
+                return await future
+            finally:
+                timer.cancel()
         except asyncio.TimeoutError:
             await self._handle_request_timeout(client_id, request_id)
             raise
         finally:
             self.client_manager.untrack_request_to_client(client_id, request_id)
 
-    async def _handle_request_timeout(self, client_id: str, request_id: str) -> None:
+    async def _handle_request_timeout(
+        self, client_id: str, request_id: str | int
+    ) -> None:
         """Clean up and notify client when request times out."""
 
         try:
@@ -364,7 +399,7 @@ class MessageCoordinator:
             )
             await self.send_notification(client_id, cancelled_notification)
         except Exception as e:
-            print(f"Error sending cancellation to {client_id}: {e}")
+            logger.warning("Error sending cancellation to %s: %s", client_id, e)
 
     # ================================
     # Send notifications
@@ -375,14 +410,16 @@ class MessageCoordinator:
     ) -> None:
         """Send a notification to a specific client.
 
+        Sent immediately, so it isn't ordered with handler responses that are
+        still waiting in the write queue.
+
         Raises:
             RuntimeError: If coordinator is not running
         """
         if not self.running:
             raise RuntimeError("Cannot send notification: coordinator is not running")
 
-        jsonrpc_notification = JSONRPCNotification.from_notification(notification)
-        await self.transport.send(client_id, jsonrpc_notification.to_wire())
+        await self.transport.send(client_id, encode_notification(notification))
 
     # ================================
     # Register handlers
@@ -395,7 +432,7 @@ class MessageCoordinator:
             method: JSON-RPC method name (e.g., "tools/list")
             handler: Async function that takes (client_id, typed_request) and handles it
         """
-        self._request_handlers[method] = handler
+        self._request_handlers[sys.intern(method)] = handler
 
     def register_notification_handler(
         self, method: str, handler: NotificationHandler
@@ -407,17 +444,12 @@ class MessageCoordinator:
             handler: Async function that takes (client_id, typed_notification) and
                 handles it
         """
-        self._notification_handlers[method] = handler
+        self._notification_handlers[sys.intern(method)] = handler
 
     # ================================
     # Helpers
     # ================================
 
-    def _ensure_client_registered(self, client_id: str) -> None:
-        """Ensure client is registered with the client manager."""
-        if not self.client_manager.get_client(client_id):
-            self.client_manager.register_client(client_id)
-
     def _should_disconnect_for_error(self, error: Error) -> bool:
         """Determine if a client should be disconnected for an error."""
         return error.code == PROTOCOL_VERSION_MISMATCH
@@ -426,5 +458,59 @@ class MessageCoordinator:
         self, client_id: str, request_id: str | int, error: Error
     ) -> None:
         """Send error response to client."""
-        response = JSONRPCError.from_error(error, request_id)
-        await self.transport.send(client_id, response.to_wire())
+        await self._queue_write(client_id, encode_error(error, request_id))
+
+    # ================================
+    # Write coalescing
+    # ================================
+
+    def _queue_write(
+        self, client_id: str, message: dict[str, Any]
+    ) -> asyncio.Future[None]:
+        """Queue a response for the client and return a future for its write.
+
+        Responses produced in the same event loop tick are flushed together
+        with one transport.send_many() call, so a burst of finished handlers
+        costs one write per client instead of one per response. Each response
+        still gets its own outcome: the future resolves once that message is
+        written, or fails with the error that kept it from being written,
+        regardless of how the rest of the batch fared.
+
+        Only responses are queued. Outbound requests and notifications are
+        sent directly, so a notification can reach the client ahead of a
+        response that was queued in the same tick.
+        """
+        written = asyncio.get_running_loop().create_future()
+
+        pending = self._pending_writes.get(client_id)
+        if pending is not None:
+            pending.append((message, written))
+            return written
+
+        self._pending_writes[client_id] = [(message, written)]
+        flush = asyncio.create_task(
+            self._flush_writes(client_id), name=f"flush_writes_{client_id}"
+        )
+        self._flush_tasks.add(flush)
+        flush.add_done_callback(self._flush_tasks.discard)
+        return written
+
+    async def _flush_writes(self, client_id: str) -> None:
+        """Send every response queued for the client in one batch."""
+        pending = self._pending_writes.pop(client_id)
+        messages = [message for message, _ in pending]
+
+        try:
+            outcomes = await self.transport.send_many(client_id, messages)
+        except Exception as e:
+            outcomes = [e] * len(pending)
+
+        for (_, written), outcome in zip(pending, outcomes, strict=True):
+            if written.done():
+                # The waiting handler was cancelled
+                continue
+            if outcome is None:
+                written.set_result(None)
+            else:
+                logger.warning("Error sending response to %s: %s", client_id, outcome)
+                written.set_exception(outcome)
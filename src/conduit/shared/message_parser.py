@@ -4,12 +4,14 @@ Handles parsing and validation of JSON-RPC messages into typed MCP objects.
 Used by both client and server sessions for consistent message handling.
 """
 
-from typing import Any
+from typing import Any, Literal
 
 from conduit.protocol.base import (
     INTERNAL_ERROR,
     INVALID_PARAMS,
     METHOD_NOT_FOUND,
+    NOTIFICATION_ENVELOPE_FIELDS,
+    REQUEST_ENVELOPE_FIELDS,
     Error,
     Notification,
     Request,
@@ -17,6 +19,51 @@ from conduit.protocol.base import (
 )
 from conduit.protocol.unions import NOTIFICATION_CLASSES, REQUEST_CLASSES
 
+type MessageKind = Literal["request", "notification", "response"]
+
+
+def _paramless_instances[T: (Request, Notification)](
+    registry: dict[str, type[T]], envelope_fields: frozenset[str]
+) -> dict[str, T]:
+    """Build one prototype instance per message type that carries no params.
+
+    A message like `ping` or `notifications/initialized` that arrives without
+    params always parses to the same value, so there's no need to validate it
+    again on every arrival. Callers hand out copies of the prototypes, never
+    the prototypes themselves, since handlers are free to mutate what they get.
+    """
+    return {
+        method: cls()
+        for method, cls in registry.items()
+        if cls.model_fields.keys() <= envelope_fields
+    }
+
+
+_PARAMLESS_REQUESTS = _paramless_instances(REQUEST_CLASSES, REQUEST_ENVELOPE_FIELDS)
+_PARAMLESS_NOTIFICATIONS = _paramless_instances(
+    NOTIFICATION_CLASSES, NOTIFICATION_ENVELOPE_FIELDS
+)
+
+
+def _has_no_params(payload: dict[str, Any]) -> bool:
+    """Check whether a payload omits params or sends an empty object.
+
+    Anything else, including malformed falsy values like `[]` or `0`, must go
+    through full validation so it's rejected the same way as before.
+    """
+    return "params" not in payload or payload["params"] == {}
+
+
+def _is_valid_id(id_value: Any) -> bool:
+    """Check for a JSON-RPC id: a str or an int.
+
+    Compares exact types, which also rules out bool (an int subclass) and
+    None without extra isinstance calls. Decoded JSON only ever produces
+    exact str and int.
+    """
+    id_type = type(id_value)
+    return id_type is str or id_type is int
+
 
 class MessageParser:
     """Parses JSON-RPC payloads into typed MCP protocol objects.
@@ -25,19 +72,37 @@ class MessageParser:
     with proper error handling and type safety.
     """
 
+    # ================================
+    # Classification
+    # ================================
+
+    def classify(self, payload: dict[str, Any]) -> MessageKind | None:
+        """Classify a JSON-RPC payload in a single pass over its keys.
+
+        Applies the same rules as is_valid_request, is_valid_notification, and
+        is_valid_response, without running each check in turn.
+
+        Args:
+            payload: Raw JSON-RPC payload from a peer.
+
+        Returns:
+            The kind of message, or None if the payload is none of them.
+        """
+        if "method" in payload:
+            if "id" not in payload:
+                return "notification"
+            return "request" if _is_valid_id(payload["id"]) else None
+        if ("result" in payload) is ("error" in payload):
+            return None
+        return "response" if _is_valid_id(payload.get("id")) else None
+
     # ================================
     # Request parsing
     # ================================
 
     def is_valid_request(self, payload: dict[str, Any]) -> bool:
         """Check if payload is a valid JSON-RPC request."""
-        id_value = payload.get("id")
-        has_valid_id = (
-            id_value is not None
-            and isinstance(id_value, (int, str))
-            and not isinstance(id_value, bool)  # Exclude booleans explicitly
-        )
-        return "method" in payload and has_valid_id
+        return "method" in payload and _is_valid_id(payload.get("id"))
 
     def parse_request(self, payload: dict[str, Any]) -> Request | Error:
         """Parse a JSON-RPC request payload into a typed Request object or Error.
@@ -51,6 +116,11 @@ class MessageParser:
             Typed Request object on success, or Error for parsing failures
         """
         method = payload["method"]
+        if _has_no_params(payload):
+            prototype = _PARAMLESS_REQUESTS.get(method)
+            if prototype is not None:
+                return prototype.model_copy()
+
         request_class = REQUEST_CLASSES.get(method)
 
         if request_class is None:
@@ -75,17 +145,11 @@ class MessageParser:
 
     def is_valid_response(self, payload: dict[str, Any]) -> bool:
         """Check if payload is a valid JSON-RPC response."""
-        id_value = payload.get("id")
-        has_valid_id = (
-            id_value is not None
-            and isinstance(id_value, (int, str))
-            and not isinstance(id_value, bool)
-        )
         has_result = "result" in payload
         has_error = "error" in payload
         has_exactly_one_response_field = has_result ^ has_error
 
-        return has_valid_id and has_exactly_one_response_field
+        return has_exactly_one_response_field and _is_valid_id(payload.get("id"))
 
     def parse_response(
         self, payload: dict[str, Any], original_request: Request
@@ -148,6 +212,11 @@ class MessageParser:
             failures
         """
         method = payload["method"]
+        if _has_no_params(payload):
+            prototype = _PARAMLESS_NOTIFICATIONS.get(method)
+            if prototype is not None:
+                return prototype.model_copy()
+
         notification_class = NOTIFICATION_CLASSES.get(method)
 
         if notification_class is None:
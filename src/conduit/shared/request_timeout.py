@@ -0,0 +1,13 @@
+import asyncio
+
+from conduit.protocol.base import Error, Result
+
+
+def expire_request(future: asyncio.Future[Result | Error]) -> None:
+    """Fail a pending request future that has outlived its timeout.
+
+    Scheduled with loop.call_later, which is cheaper than wrapping every
+    request in asyncio.wait_for.
+    """
+    if not future.done():
+        future.set_exception(TimeoutError())
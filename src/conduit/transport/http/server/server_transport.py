@@ -85,7 +85,7 @@ class HTTPTransport(ServerTransport):
             self._server_task.cancel()
 
         # Clean up components
-        await self._stream_manager.close()  # NOT IMPLEMENTED
+        await self._stream_manager.close()
         await self._message_sender.close()  # NOT IMPLEMENTED
 
     # HTTP endpoint handlers (unchanged)
@@ -234,13 +234,21 @@ class HTTPTransport(ServerTransport):
 
     # Message queue iterator
     async def _client_message_iterator(self) -> AsyncIterator[ClientMessage]:
-        """Async iterator over client messages."""
+        """Async iterator over client messages.
+
+        Waits (with a timeout, so close() is noticed) only when the queue is
+        empty. Anything that queued up in the meantime is drained directly
+        instead of paying for a fresh timed wait per message.
+        """
         while not self._closed:
             try:
                 message = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
-                yield message
             except asyncio.TimeoutError:
                 continue
+            yield message
+
+            while not self._closed and not self._message_queue.empty():
+                yield self._message_queue.get_nowait()
 
     # Helper methods
     def _is_initialize_request(self, message: dict[str, Any]) -> bool:
@@ -136,6 +136,12 @@ class StreamManager:
         # Remove client tracking
         self._client_streams.pop(client_id, None)
 
+    async def close(self) -> None:
+        """Clean up every client's streams."""
+        self._closed = True
+        for client_id in list(self._client_streams):
+            await self.cleanup_client(client_id)
+
     async def _cleanup_stream(self, stream_id: str) -> None:
         """Clean up a specific stream."""
         # Clear event tracking for this stream
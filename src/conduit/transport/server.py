@@ -37,6 +37,34 @@ class ServerTransport(ABC):
         """
         ...
 
+    async def send_many(
+        self, client_id: str, messages: list[dict[str, Any]]
+    ) -> list[Exception | None]:
+        """Send several messages to a specific client, in order.
+
+        Each message succeeds or fails on its own, so one bad message never
+        takes the rest of the batch down with it.
+
+        The default sends each message with send(). Transports that can write
+        a batch more cheaply (one buffered write, one flush) should override it.
+
+        Args:
+            client_id: Target client connection ID
+            messages: JSON-RPC messages to send
+
+        Returns:
+            One outcome per message, in order: None if it was written, or the
+            exception that kept it from being written.
+        """
+        outcomes: list[Exception | None] = []
+        for message in messages:
+            try:
+                await self.send(client_id, message)
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
     @abstractmethod
     def client_messages(self) -> AsyncIterator[ClientMessage]:
         """Stream of messages from all clients with explicit client context.
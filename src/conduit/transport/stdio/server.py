@@ -63,6 +63,49 @@ class StdioServerTransport(ServerTransport):
             self._is_open = False
             raise ConnectionError(f"Failed to send message: {e}") from e
 
+    async def send_many(
+        self, client_id: str, messages: list[dict[str, Any]]
+    ) -> list[Exception | None]:
+        """Send several messages to the client with a single write and flush.
+
+        Messages that fail to serialize are skipped and reported; the rest are
+        still written.
+
+        Args:
+            client_id: Ignored for stdio (always 1:1 relationship)
+            messages: JSON-RPC messages to send, in order
+
+        Returns:
+            One outcome per message, in order: None if it was written, a
+            ValueError if it was invalid, or a ConnectionError if stdout is
+            closed or the write failed.
+        """
+        if not self.is_open:
+            closed = ConnectionError("Transport is closed")
+            return [closed] * len(messages)
+
+        outcomes: list[Exception | None] = []
+        lines: list[str] = []
+        for message in messages:
+            try:
+                lines.append(serialize_message(message))
+                outcomes.append(None)
+            except ValueError as e:
+                outcomes.append(e)
+
+        if not lines:
+            return outcomes
+
+        try:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        except Exception as e:
+            self._is_open = False
+            failed = ConnectionError(f"Failed to send messages: {e}")
+            return [failed if outcome is None else outcome for outcome in outcomes]
+
+        return outcomes
+
     def client_messages(self) -> AsyncIterator[ClientMessage]:
         """Stream of messages from the client with explicit client context."""
         return self._client_message_iterator()
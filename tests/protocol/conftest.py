@@ -0,0 +1,83 @@
+from typing import Any
+
+import pytest
+
+from conduit.protocol.resources import Annotations, Resource, ResourceTemplate
+from conduit.protocol.tools import JSONSchema, Tool, ToolAnnotations
+
+
+def wire(payload: dict[str, Any]) -> dict[str, Any]:
+    """Wrap a protocol payload in a JSON-RPC envelope with id 1.
+
+    Pass a request or notification payload directly, or a result as
+    {"result": payload}.
+    """
+    wire_format = {"jsonrpc": "2.0", "id": 1}
+    wire_format.update(payload)
+    return wire_format
+
+
+# Protocol models aren't mutated by the tests that use these, so each one is
+# built and validated once per session. Copy before mutating.
+
+# Module-level so parametrize lists can use them too, not just fixtures.
+EXAMPLE_RESOURCE = Resource(
+    uri="https://example.com",
+    name="Example",
+    annotations=Annotations(audience="user", priority=0.5),
+)
+
+RESOURCE_TEMPLATE = ResourceTemplate(
+    name="Test",
+    uri_template="https://example.com/{resource_id}",
+)
+
+
+@pytest.fixture(scope="session")
+def example_resource() -> Resource:
+    return EXAMPLE_RESOURCE
+
+
+@pytest.fixture(scope="session")
+def resource_template() -> ResourceTemplate:
+    return RESOURCE_TEMPLATE
+
+
+@pytest.fixture(scope="session")
+def search_tool() -> Tool:
+    return Tool(
+        name="search_files",
+        description="Search for files",
+        input_schema=JSONSchema(
+            type="object",
+            properties={
+                "query": {"type": "string", "description": "Search term"},
+                "limit": {"type": "integer", "minimum": 1, "default": 10},
+            },
+            required=["query"],
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def complex_tool() -> Tool:
+    return Tool(
+        name="complex_tool",
+        description="A tool with complex schema",
+        input_schema=JSONSchema(
+            properties={
+                "config": {
+                    "type": "object",
+                    "properties": {
+                        "timeout": {"type": "integer"},
+                        "retries": {"type": "integer"},
+                    },
+                },
+                "files": {"type": "array", "items": {"type": "string"}},
+            },
+            required=["config"],
+        ),
+        annotations=ToolAnnotations(
+            title="Complex Tool", read_only_hint=True, destructive_hint=False
+        ),
+    )
@@ -18,3 +18,13 @@ def test_key_types_are_available():
     assert protocol.TextContent
     assert protocol.ClientRequest
     assert protocol.JSONRPCRequest
+
+
+def test_message_unions_support_isinstance():
+    """The exported unions are runtime unions, usable with isinstance."""
+    assert isinstance(protocol.PingRequest(), protocol.ClientRequest)
+    assert isinstance(protocol.PingRequest(), protocol.ServerRequest)
+    assert isinstance(protocol.InitializedNotification(), protocol.ClientNotification)
+    assert not isinstance(
+        protocol.InitializedNotification(), protocol.ServerNotification
+    )
@@ -6,7 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from conduit.protocol.base import PROTOCOL_VERSION, Error
-from conduit.protocol.common import PingRequest, ProgressNotification
+from conduit.protocol.common import EmptyResult, PingRequest, ProgressNotification
 from conduit.protocol.initialization import (
     ClientCapabilities,
     Implementation,
@@ -20,8 +20,13 @@ from conduit.protocol.jsonrpc import (
     JSONRPCNotification,
     JSONRPCRequest,
     JSONRPCResponse,
+    encode_error,
+    encode_notification,
+    encode_request,
+    encode_response,
 )
 from conduit.protocol.resources import ListResourcesRequest
+from conduit.protocol.tools import ToolListChangedNotification
 
 
 class TestJSONRPCSerializing:
@@ -140,3 +145,68 @@ class TestJSONRPCSerializing:
         request = InitializeRequest.from_protocol(wire_data)
         assert request.method == "initialize"
         assert request.client_info.name == "Test client"
+
+
+class TestWireEncoders:
+    def test_encoders_match_wrapper_wire_format(self):
+        # Arrange
+        request = ListResourcesRequest(cursor="xyz", progress_token="abc")
+        notification = ProgressNotification(progress_token="abc", progress=0.5)
+        result = InitializeResult(
+            capabilities=ServerCapabilities(),
+            server_info=Implementation(name="Test server", version="1"),
+        )
+        error = Error(code=-32601, message="Method not found")
+
+        # Act & Assert
+        assert encode_request(request, 1) == (
+            JSONRPCRequest.from_request(request, 1).to_wire()
+        )
+        assert encode_notification(notification) == (
+            JSONRPCNotification.from_notification(notification).to_wire()
+        )
+        assert encode_response(result, "abc") == (
+            JSONRPCResponse.from_result(result, "abc").to_wire()
+        )
+        assert encode_error(error, 2) == JSONRPCError.from_error(error, 2).to_wire()
+
+    def test_encode_response_builds_envelope(self):
+        # Arrange
+        result = InitializeResult(
+            capabilities=ServerCapabilities(),
+            server_info=Implementation(name="Test server", version="1"),
+        )
+
+        # Act
+        wire_data = encode_response(result, 7)
+
+        # Assert
+        assert wire_data == {
+            "jsonrpc": JSONRPC_VERSION,
+            "id": 7,
+            "result": result.to_protocol(),
+        }
+
+    def test_constant_messages_match_full_serialization(self):
+        # Arrange
+        plain_result = EmptyResult()
+        result_with_meta = EmptyResult(metadata={"trace": "abc"})
+        plain_notification = ToolListChangedNotification()
+        notification_with_meta = ToolListChangedNotification(metadata={"n": 1})
+
+        # Act & Assert
+        assert encode_response(plain_result, 1) == {
+            "jsonrpc": JSONRPC_VERSION,
+            "id": 1,
+            "result": {},
+        }
+        assert encode_response(result_with_meta, 1)["result"] == {
+            "_meta": {"trace": "abc"}
+        }
+        assert encode_notification(plain_notification) == {
+            "jsonrpc": JSONRPC_VERSION,
+            "method": "notifications/tools/list_changed",
+        }
+        assert encode_notification(notification_with_meta)["params"] == {
+            "_meta": {"n": 1}
+        }
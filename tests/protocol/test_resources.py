@@ -2,81 +2,56 @@
 Test resource-related types.
 """
 
+import pytest
+
+from conduit.protocol.base import Request
 from conduit.protocol.resources import (
-    Annotations,
     ListResourcesRequest,
     ListResourcesResult,
     ListResourceTemplatesResult,
     ReadResourceResult,
     Resource,
-    ResourceTemplate,
     SubscribeRequest,
     TextResourceContents,
     UnsubscribeRequest,
 )
 
+from .conftest import EXAMPLE_RESOURCE, RESOURCE_TEMPLATE, wire
+
+# Shared, read-only inputs. from_protocol doesn't mutate what it's given.
+LIST_RESOURCES_PAYLOAD = {
+    "method": "resources/list",
+    "params": {"cursor": "abc"},
+}
+LIST_RESOURCES_WIRE = wire(LIST_RESOURCES_PAYLOAD)
+
+LIST_RESOURCES_WITH_META_PAYLOAD = {
+    "method": "resources/list",
+    "params": {"cursor": "abc", "_meta": {"progressToken": "123"}},
+}
+LIST_RESOURCES_WITH_META_WIRE = wire(LIST_RESOURCES_WITH_META_PAYLOAD)
+
 
 class TestResources:
     def test_list_resource_request_roundtrip_with_cursor(self):
-        # Arrange
-        payload = {
-            "method": "resources/list",
-            "params": {"cursor": "abc"},
-        }
-        wire_format = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            **payload,
-        }
-
         # Act
-        req = ListResourcesRequest.from_protocol(wire_format)
+        req = ListResourcesRequest.from_protocol(LIST_RESOURCES_WIRE)
 
         # Assert
         assert req.cursor == "abc"
         assert req.method == "resources/list"
-        assert req.to_protocol() == payload
+        assert req.to_protocol() == LIST_RESOURCES_PAYLOAD
 
     def test_list_resource_request_roundtrip_with_cursor_and_metadata(self):
-        # Arrange
-        payload = {
-            "method": "resources/list",
-            "params": {"cursor": "abc", "_meta": {"progressToken": "123"}},
-        }
-        wire_format = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            **payload,
-        }
-
         # Act
-        req = ListResourcesRequest.from_protocol(wire_format)
+        req = ListResourcesRequest.from_protocol(LIST_RESOURCES_WITH_META_WIRE)
         serialized = req.to_protocol()
 
         # Assert
         assert req.cursor == "abc"
         assert req.progress_token == "123"
         assert req.method == "resources/list"
-        assert serialized == payload
-
-    def test_list_resources_result_roundtrips(self):
-        # Arrange
-        resource = Resource(
-            uri="https://example.com",
-            name="Example",
-            annotations=Annotations(audience="user", priority=0.5),
-        )
-        res = ListResourcesResult(
-            resources=[resource],
-            next_cursor="next",
-        )
-        # Act
-        result_payload = res.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": result_payload}
-
-        # Assert
-        from_protocol = ListResourcesResult.from_protocol(wire_format)
-        assert from_protocol == res
+        assert serialized == LIST_RESOURCES_WITH_META_PAYLOAD
 
     def test_list_resources_uses_alias_for_mime_type(self):
         # Arrange
@@ -92,10 +67,12 @@ class TestResources:
         serialized = result.to_protocol()
 
         # Assert
-        serialized_resource = serialized["resources"][0]
-        assert "mime_type" not in serialized_resource
-        assert serialized_resource["mimeType"] == "text/plain"
-        assert serialized_resource["size"] == 1
+        assert serialized["resources"][0] == {
+            "uri": "https://example.com",
+            "name": "Example",
+            "mimeType": "text/plain",
+            "size": 1,
+        }
 
     def test_list_resources_serializes_with_resource_metadata_and_result_metadata(self):
         # Arrange
@@ -113,14 +90,9 @@ class TestResources:
         assert serialized["_meta"] == {"crazy": "pants"}
         assert serialized["resources"][0]["_meta"] == {"ack": "barnacle"}
 
-    def test_resource_result_serializes_with_annotation(self):
+    def test_resource_result_serializes_with_annotation(self, example_resource):
         # Arrange
-        resource = Resource(
-            uri="https://example.com",
-            name="Example",
-            annotations=Annotations(audience="user", priority=0.5),
-        )
-        result = ListResourcesResult(resources=[resource])
+        result = ListResourcesResult(resources=[example_resource])
         expected = {
             "resources": [
                 {
@@ -137,19 +109,17 @@ class TestResources:
         # Assert
         assert serialized == expected
 
-    def test_list_resource_template_result_serializes_with_uri_template(self):
+    def test_list_resource_template_result_serializes_with_uri_template(
+        self, resource_template
+    ):
         # Arrange
-        resource_template = ResourceTemplate(
-            name="Test",
-            uri_template="https://example.com/{resource_id}",
-        )
         result = ListResourceTemplatesResult(
             resource_templates=[resource_template],
         )
 
         # Act
         serialized = result.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": serialized}
+        wire_format = wire({"result": serialized})
 
         # Assert
         assert wire_format["result"] == {
@@ -161,60 +131,33 @@ class TestResources:
             ]
         }
 
-    def test_list_resource_template_result_roundtrips(self):
-        # Arrange
-        resource_template = ResourceTemplate(
-            name="Test",
-            uri_template="https://example.com/{resource_id}",
-        )
-        result = ListResourceTemplatesResult(
-            resource_templates=[resource_template],
-        )
-
-        # Act
-        result_payload = result.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": result_payload}
-        reconstructed = ListResourceTemplatesResult.from_protocol(wire_format)
-
-        # Assert
-        assert reconstructed == result
-
-    def test_read_resource_result_roundtrips(self):
-        # Arrange
-        result = ReadResourceResult(
-            contents=[
-                TextResourceContents(uri="https://example.com/", text="Hello, world!"),
-            ],
-        )
-
-        # Act
-        result_payload = result.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": result_payload}
-        reconstructed = ReadResourceResult.from_protocol(wire_format)
-
-        # Assert
-        assert reconstructed == result
-
-    def test_subscribe_request_method_roundtrips(self):
-        # Arrange
-        request = SubscribeRequest(uri="https://example.com/")
-
-        # Act
-        protocol_data = request.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, **protocol_data}
-        reconstructed = SubscribeRequest.from_protocol(wire_format)
-
-        # Assert
-        assert reconstructed == request
-
-    def test_unsubscribe_request_method_roundtrips(self):
+    @pytest.mark.parametrize(
+        "message",
+        [
+            ListResourcesResult(resources=[EXAMPLE_RESOURCE], next_cursor="next"),
+            ListResourceTemplatesResult(resource_templates=[RESOURCE_TEMPLATE]),
+            ReadResourceResult(
+                contents=[
+                    TextResourceContents(
+                        uri="https://example.com/", text="Hello, world!"
+                    ),
+                ],
+            ),
+            SubscribeRequest(uri="https://example.com/"),
+            UnsubscribeRequest(uri="https://example.com/"),
+        ],
+        ids=lambda message: type(message).__name__,
+    )
+    def test_message_roundtrips(self, message):
         # Arrange
-        request = UnsubscribeRequest(uri="https://example.com/")
+        protocol_data = message.to_protocol()
+        if isinstance(message, Request):
+            wire_format = wire(protocol_data)
+        else:
+            wire_format = wire({"result": protocol_data})
 
         # Act
-        protocol_data = request.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, **protocol_data}
-        reconstructed = UnsubscribeRequest.from_protocol(wire_format)
+        reconstructed = type(message).from_protocol(wire_format)
 
         # Assert
-        assert reconstructed == request
+        assert reconstructed == message
@@ -10,9 +10,15 @@ from conduit.protocol.tools import (
     ListToolsRequest,
     ListToolsResult,
     Tool,
-    ToolAnnotations,
 )
 
+from .conftest import wire
+
+COMPLEX_RESULT_METADATA = {
+    "some": "metadata",
+    "other": "metadata",
+}
+
 
 class TestTools:
     def test_list_tools_request_round_trip_with_cursor_and_progress_token(self):
@@ -24,7 +30,7 @@ class TestTools:
 
         # Act
         protocol_data = request.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, **protocol_data}
+        wire_format = wire(protocol_data)
         reconstructed = ListToolsRequest.from_protocol(wire_format)
 
         # Assert
@@ -45,11 +51,7 @@ class TestTools:
                 "_meta": {"some": {"nested": "value"}},
             },
         }
-        wire_format = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            **payload,
-        }
+        wire_format = wire(payload)
 
         # Act
         progress_notif = ProgressNotification.from_protocol(wire_format)
@@ -77,11 +79,7 @@ class TestTools:
                 "_meta": {},
             },
         }
-        wire_format = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            **payload,
-        }
+        wire_format = wire(payload)
 
         # Act
         notif = ProgressNotification.from_protocol(wire_format)
@@ -95,7 +93,7 @@ class TestTools:
 
         # Act
         protocol_data = request.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, **protocol_data}
+        wire_format = wire(protocol_data)
         reconstructed = ListToolsRequest.from_protocol(wire_format)
 
         # Assert
@@ -103,28 +101,13 @@ class TestTools:
         assert reconstructed.method == "tools/list"
         assert reconstructed.cursor == "page_2"
 
-    def test_list_tools_result_roundtrip_with_tool_schema(self):
+    def test_list_tools_result_roundtrip_with_tool_schema(self, search_tool):
         # Arrange
-        schema = JSONSchema(
-            type="object",
-            properties={
-                "query": {"type": "string", "description": "Search term"},
-                "limit": {"type": "integer", "minimum": 1, "default": 10},
-            },
-            required=["query"],
-        )
-
-        tool = Tool(
-            name="search_files",
-            description="Search for files",
-            input_schema=schema,
-        )
-
-        result = ListToolsResult(tools=[tool], next_cursor="next_page_token")
+        result = ListToolsResult(tools=[search_tool], next_cursor="next_page_token")
 
         # Act
         serialized = result.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": serialized}
+        wire_format = wire({"result": serialized})
         reconstructed = ListToolsResult.from_protocol(wire_format)
 
         # Assert
@@ -159,44 +142,19 @@ class TestTools:
             "required": ["name"],
         }
 
-    def test_list_tools_result_protocol_roundtrip_complex_nested_schema(self):
+    def test_list_tools_result_protocol_roundtrip_complex_nested_schema(
+        self, complex_tool
+    ):
         # Arrange
-        schema = JSONSchema(
-            properties={
-                "config": {
-                    "type": "object",
-                    "properties": {
-                        "timeout": {"type": "integer"},
-                        "retries": {"type": "integer"},
-                    },
-                },
-                "files": {"type": "array", "items": {"type": "string"}},
-            },
-            required=["config"],
-        )
-
-        annotations = ToolAnnotations(
-            title="Complex Tool", read_only_hint=True, destructive_hint=False
-        )
-
-        tool = Tool(
-            name="complex_tool",
-            description="A tool with complex schema",
-            input_schema=schema,
-            annotations=annotations,
-        )
-        metadata = {
-            "some": "metadata",
-            "other": "metadata",
-        }
-
         original_result = ListToolsResult(
-            tools=[tool], next_cursor="next_page", metadata=metadata
+            tools=[complex_tool],
+            next_cursor="next_page",
+            metadata=COMPLEX_RESULT_METADATA,
         )
 
         # Act
         serialized = original_result.to_protocol()
-        wire_format = {"jsonrpc": "2.0", "id": 1, "result": serialized}
+        wire_format = wire({"result": serialized})
         reconstructed_result = ListToolsResult.from_protocol(wire_format)
 
         # Assert that the serialized result is valid
@@ -208,30 +166,27 @@ class TestTools:
         assert len(reconstructed_result.tools) == 1
         reconstructed_tool = reconstructed_result.tools[0]
 
+        properties = reconstructed_tool.input_schema.properties
+        config_schema = properties["config"]
+        files_schema = properties["files"]
+        annotations = reconstructed_tool.annotations
+
         # Assert
-        assert reconstructed_tool.input_schema.properties["config"]["type"] == "object"
-        assert (
-            reconstructed_tool.input_schema.properties["config"]["properties"][
-                "timeout"
-            ]["type"]
-            == "integer"
-        )
-        assert (
-            reconstructed_tool.input_schema.properties["files"]["items"]["type"]
-            == "string"
-        )
+        assert config_schema["type"] == "object"
+        assert config_schema["properties"]["timeout"]["type"] == "integer"
+        assert files_schema["items"]["type"] == "string"
         assert reconstructed_tool.input_schema.required == ["config"]
 
         # Assert
-        assert reconstructed_tool.annotations.title == "Complex Tool"
-        assert reconstructed_tool.annotations.read_only_hint is True
-        assert reconstructed_tool.annotations.destructive_hint is False
+        assert annotations.title == "Complex Tool"
+        assert annotations.read_only_hint is True
+        assert annotations.destructive_hint is False
 
         # Assert
         assert reconstructed_result.next_cursor == "next_page"
 
         # Assert
-        assert reconstructed_result.metadata == metadata
+        assert reconstructed_result.metadata == COMPLEX_RESULT_METADATA
 
     def test_call_tool_result_roundtrip_with_structured_content(self):
         # Arrange
@@ -14,16 +14,26 @@ class MockServerTransport(ServerTransport):
 
     def __init__(self):
         self.sent_messages: dict[str, list[dict[str, Any]]] = {}
+        self.sent_batches: dict[str, list[list[dict[str, Any]]]] = {}
         self.client_message_queue: asyncio.Queue[ClientMessage] = asyncio.Queue()
         self._should_raise_error = False
+        self._rejected_result_ids: set[str | int] = set()
 
     async def send(self, client_id: str, message: dict[str, Any]) -> None:
         if self._should_raise_error:
             raise ConnectionError("Transport error")
+        if message.get("id") in self._rejected_result_ids and "result" in message:
+            raise ValueError("Failed to serialize message")
         if client_id not in self.sent_messages:
             self.sent_messages[client_id] = []
         self.sent_messages[client_id].append(message)
 
+    async def send_many(
+        self, client_id: str, messages: list[dict[str, Any]]
+    ) -> list[Exception | None]:
+        self.sent_batches.setdefault(client_id, []).append(list(messages))
+        return await super().send_many(client_id, messages)
+
     async def disconnect_client(self, client_id: str) -> None:
         """Disconnect specific client."""
         # For testing, just remove from sent_messages tracking
@@ -34,6 +44,10 @@ class MockServerTransport(ServerTransport):
         """Simulate a transport error."""
         self._should_raise_error = True
 
+    def reject_result_for(self, request_id: str | int) -> None:
+        """Simulate an unsendable success response for one request."""
+        self._rejected_result_ids.add(request_id)
+
     def client_messages(self) -> AsyncIterator[ClientMessage]:
         return self._client_message_iterator()
 
@@ -18,18 +18,18 @@ class TestCancelAPI:
         # Register client and create a mock task
         client_manager.register_client(client_id)
         mock_task = asyncio.create_task(asyncio.sleep(10))
-        client_manager.track_request_from_client(
-            client_id, request_id, mock_request, mock_task
-        )
+        with client_manager.tracking(client_id, request_id, mock_request, mock_task):
+            # Verify task is tracked
+            assert client_manager.get_request_from_client(client_id, request_id) == (
+                mock_request,
+                mock_task,
+            )
 
-        # Verify task is tracked
-        assert client_manager.get_request_from_client(client_id, request_id) == (
-            mock_request,
-            mock_task,
-        )
+            # Act: Cancel the specific request
+            result = await coordinator.cancel_request_from_client(client_id, request_id)
 
-        # Act: Cancel the specific request
-        result = await coordinator.cancel_request_from_client(client_id, request_id)
+            # Assert: Request was removed from tracking by the cancel itself
+            assert client_manager.get_request_from_client(client_id, request_id) is None
 
         # Assert: Request was found and successfully cancelled
         assert result is True
@@ -39,9 +39,6 @@ class TestCancelAPI:
             pass
         assert mock_task.cancelled()
 
-        # Assert: Request was removed from tracking
-        assert client_manager.get_request_from_client(client_id, request_id) is None
-
     async def test_cancel_request_from_client_not_found(
         self, coordinator, client_manager
     ):
@@ -70,19 +67,16 @@ class TestCancelAPI:
 
         # Create a task that completes immediately
         mock_task = asyncio.create_task(asyncio.sleep(0))
-        client_manager.track_request_from_client(
-            client_id, request_id, mock_request, mock_task
-        )
+        with client_manager.tracking(client_id, request_id, mock_request, mock_task):
+            # Wait for task to complete
+            await yield_loop()
+            assert mock_task.done()
 
-        # Wait for task to complete
-        await yield_loop()
-        assert mock_task.done()
+            # Act: Try to cancel the already completed request
+            result = await coordinator.cancel_request_from_client(client_id, request_id)
 
-        # Act: Try to cancel the already completed request
-        result = await coordinator.cancel_request_from_client(client_id, request_id)
+            # Assert: Request was still removed from tracking
+            assert client_manager.get_request_from_client(client_id, request_id) is None
 
         # Assert: Returns False (task was found but couldn't be cancelled)
         assert result is False
-
-        # Assert: Request was still removed from tracking
-        assert client_manager.get_request_from_client(client_id, request_id) is None
@@ -34,6 +34,19 @@ class TestMessageCoordinatorLifecycle:
         await coordinator.stop()  # Should be safe to call again
         assert not coordinator.running
 
+    async def test_stop_flushes_queued_responses(self, coordinator, mock_transport):
+        # Arrange
+        await coordinator.start()
+        coordinator._queue_write("client-1", {"jsonrpc": "2.0", "id": 1, "result": {}})
+
+        # Act
+        await coordinator.stop()
+
+        # Assert
+        assert mock_transport.sent_messages["client-1"] == [
+            {"jsonrpc": "2.0", "id": 1, "result": {}}
+        ]
+
     async def test_stop_without_start_is_safe(self, coordinator):
         # Arrange
         assert not coordinator.running
@@ -119,23 +132,20 @@ class TestMessageCoordinatorLifecycle:
         assert client_manager.client_count() == 2
 
         # Track requests
-        client_manager.track_request_from_client(
-            "client1", "req1", mock_request1, task1
-        )
-        client_manager.track_request_from_client(
-            "client2", "req2", mock_request2, task2
-        )
-
-        client_manager.track_request_to_client(
-            "client1", "ping1", PingRequest(), future1
-        )
-        client_manager.track_request_to_client(
-            "client2", "ping2", PingRequest(), future2
-        )
-
-        # Act
-        await coordinator.stop()
-        await yield_loop()
+        with (
+            client_manager.tracking("client1", "req1", mock_request1, task1),
+            client_manager.tracking("client2", "req2", mock_request2, task2),
+        ):
+            client_manager.track_request_to_client(
+                "client1", "ping1", PingRequest(), future1
+            )
+            client_manager.track_request_to_client(
+                "client2", "ping2", PingRequest(), future2
+            )
+
+            # Act
+            await coordinator.stop()
+            await yield_loop()
 
         # Assert - both types of requests are cancelled
         assert task1.cancelled()
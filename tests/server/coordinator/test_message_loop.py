@@ -120,26 +120,26 @@ class TestMessageLoop:
 
         # Set up clients with both types of requests
         client_manager.register_client("client1")
-        client_manager.track_request_from_client(
+        with client_manager.tracking(
             "client1", "ping_from_client", PingRequest(), task1
-        )
-        client_manager.track_request_to_client(
-            "client1", "ping_to_client", PingRequest(), future1
-        )
-
-        assert client_manager.client_count() == 1
-        assert (
-            client_manager.get_request_from_client("client1", "ping_from_client")
-            is not None
-        )
-        assert (
-            client_manager.get_request_to_client("client1", "ping_to_client")
-            is not None
-        )
-
-        # Act - simulate transport failure (unexpected exit)
-        mock_transport.simulate_error()
-        await yield_loop()
+        ):
+            client_manager.track_request_to_client(
+                "client1", "ping_to_client", PingRequest(), future1
+            )
+
+            assert client_manager.client_count() == 1
+            assert (
+                client_manager.get_request_from_client("client1", "ping_from_client")
+                is not None
+            )
+            assert (
+                client_manager.get_request_to_client("client1", "ping_to_client")
+                is not None
+            )
+
+            # Act - simulate transport failure (unexpected exit)
+            mock_transport.simulate_error()
+            await yield_loop()
 
         # Assert - all client state cleaned up
         assert not coordinator.running
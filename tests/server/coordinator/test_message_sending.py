@@ -169,6 +169,33 @@ class TestRequestSending:
         assert client_context is not None
         assert len(client_context.requests_to_client) == 0
 
+    async def test_assigns_unique_integer_request_ids(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        client_id = "test_client"
+        await coordinator.start()
+
+        # Act - send two requests in background
+        tasks = [
+            asyncio.create_task(
+                coordinator.send_request(client_id, PingRequest(), timeout=1.0)
+            )
+            for _ in range(2)
+        ]
+        await yield_loop()
+
+        # Assert - each request got its own integer ID
+        sent_messages = mock_transport.sent_messages[client_id]
+        request_ids = [message["id"] for message in sent_messages]
+        assert all(isinstance(request_id, int) for request_id in request_ids)
+        assert len(set(request_ids)) == 2
+
+        # Cleanup
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class TestNotificationSending:
     async def test_send_notification_fails_when_not_running(self, coordinator):
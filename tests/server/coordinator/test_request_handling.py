@@ -1,8 +1,10 @@
 import asyncio
 
-from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND
+import pytest
+
+from conduit.protocol.base import INTERNAL_ERROR, METHOD_NOT_FOUND, Error
 from conduit.protocol.common import EmptyResult
-from conduit.protocol.jsonrpc import Request
+from conduit.protocol.jsonrpc import Request, encode_error
 from conduit.protocol.resources import ReadResourceRequest, ReadResourceResult
 
 
@@ -237,3 +239,106 @@ class TestRequestHandling:
 
         error = response["error"]
         assert error["code"] == METHOD_NOT_FOUND
+
+    async def test_ignores_request_with_invalid_id(
+        self, coordinator, mock_transport, yield_loop, caplog
+    ):
+        # Arrange
+        handler_called = False
+
+        async def should_not_be_called(client_id: str, request: Request) -> EmptyResult:
+            nonlocal handler_called
+            handler_called = True
+            return EmptyResult()
+
+        coordinator.register_request_handler("ping", should_not_be_called)
+        await coordinator.start()
+
+        # Act: "id" is present but null, so this is neither a request nor a
+        # notification
+        mock_transport.add_client_message(
+            "client-1", {"jsonrpc": "2.0", "id": None, "method": "ping"}
+        )
+        await yield_loop()
+
+        # Assert
+        assert not handler_called
+        assert "client-1" not in mock_transport.sent_messages
+        assert "Unknown message type from client-1" in caplog.text
+
+    async def test_batches_responses_queued_in_same_tick(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        await coordinator.start()
+        error = Error(code=METHOD_NOT_FOUND, message="No handler")
+
+        # Act: queue two responses without yielding to the event loop
+        first_write = coordinator._queue_write("client-1", encode_error(error, 1))
+        second_write = coordinator._queue_write("client-1", encode_error(error, 2))
+        await asyncio.gather(first_write, second_write)
+
+        # Assert: both responses went out, in order, in a single batch
+        responses = mock_transport.sent_messages["client-1"]
+        assert [response["id"] for response in responses] == [1, 2]
+        assert len(mock_transport.sent_batches["client-1"]) == 1
+
+    async def test_response_write_failure_reaches_the_sender(
+        self, coordinator, mock_transport
+    ):
+        # Arrange
+        await coordinator.start()
+        mock_transport.simulate_error()
+        error = Error(code=METHOD_NOT_FOUND, message="No handler")
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await coordinator._send_error("client-1", 1, error)
+
+    async def test_failed_message_does_not_fail_the_rest_of_its_batch(
+        self, coordinator, mock_transport
+    ):
+        # Arrange
+        await coordinator.start()
+        mock_transport.reject_result_for(2)
+        responses = [{"jsonrpc": "2.0", "id": i, "result": {}} for i in (1, 2, 3)]
+
+        # Act: all three land in the same batch
+        writes = [coordinator._queue_write("client-1", r) for r in responses]
+        outcomes = await asyncio.gather(*writes, return_exceptions=True)
+
+        # Assert: only the bad message failed; its neighbours were written
+        assert outcomes[0] is None
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] is None
+        sent = mock_transport.sent_messages["client-1"]
+        assert [message["id"] for message in sent] == [1, 3]
+        assert len(mock_transport.sent_batches["client-1"]) == 1
+
+    async def test_sent_response_is_never_followed_by_an_error(
+        self, coordinator, mock_transport, yield_loop
+    ):
+        # Arrange
+        async def ping_handler(client_id: str, request: Request) -> EmptyResult:
+            return EmptyResult()
+
+        coordinator.register_request_handler("ping", ping_handler)
+        mock_transport.reject_result_for(2)
+        await coordinator.start()
+
+        # Act
+        for request_id in (1, 2, 3):
+            mock_transport.add_client_message(
+                "client-1", {"jsonrpc": "2.0", "id": request_id, "method": "ping"}
+            )
+        await yield_loop()
+
+        # Assert: one message per id; only the unwritable result became an error
+        sent = {
+            message["id"]: message
+            for message in mock_transport.sent_messages["client-1"]
+        }
+        assert len(mock_transport.sent_messages["client-1"]) == 3
+        assert sent[1] == {"jsonrpc": "2.0", "id": 1, "result": {}}
+        assert sent[2]["error"]["code"] == INTERNAL_ERROR
+        assert sent[3] == {"jsonrpc": "2.0", "id": 3, "result": {}}
@@ -65,6 +65,33 @@ class TestRegistration:
         assert first_state is not second_state
         assert retrieved_state is second_state
 
+    def test_register_if_absent_registers_new_client(self):
+        # Arrange
+        manager = ClientManager()
+        client_id = "test-client"
+
+        # Act
+        state = manager.register_if_absent(client_id)
+
+        # Assert
+        assert isinstance(state, ClientState)
+        assert manager.get_client(client_id) is state
+
+    def test_register_if_absent_keeps_existing_state(self):
+        # Arrange
+        manager = ClientManager()
+        client_id = "test-client"
+        existing_state = manager.register_client(client_id)
+        existing_state.initialized = True
+
+        # Act
+        state = manager.register_if_absent(client_id)
+
+        # Assert
+        assert state is existing_state
+        assert state.initialized is True
+        assert manager.client_count() == 1
+
     def test_initialize_registered_client(self):
         # Arrange
         manager = ClientManager()
@@ -305,7 +332,7 @@ class TestOutboundRequests:
 
 
 class TestInboundRequests:
-    async def test_track_request_from_client(self):
+    async def test_untrack_request_from_client(self):
         # Arrange
         manager = ClientManager()
         client_id = "test-client-123"
@@ -313,41 +340,63 @@ class TestInboundRequests:
 
         manager.register_client(client_id)
 
-        # Create mock request and task
         request = PingRequest()
-        task = asyncio.create_task(asyncio.sleep(0))  # Simple task for testing
+        task = asyncio.create_task(asyncio.sleep(0))
 
-        # Act
-        manager.track_request_from_client(client_id, request_id, request, task)
+        # Track first, then untrack
+        with manager.tracking(client_id, request_id, request, task):
+            assert manager.get_request_from_client(client_id, request_id) is not None
 
-        # Assert
-        client_state = manager.get_client(client_id)
-        assert client_state is not None
+            # Act
+            result = manager.untrack_request_from_client(client_id, request_id)
 
-        tracked_request, tracked_task = client_state.requests_from_client[request_id]
-        assert tracked_request is request
-        assert tracked_task is task
+            # Assert: removed from tracking before the block exits
+            client_state = manager.get_client(client_id)
+            assert request_id not in client_state.requests_from_client
+
+        # Assert
+        assert result is not None
+        untracked_request, untracked_task = result
+        assert untracked_request is request
+        assert untracked_task is task
 
         # Cleanup
         task.cancel()
 
-    async def test_track_request_from_client_raises_for_unregistered_client(self):
+    async def test_untrack_request_from_client_raises_for_unregistered_client(self):
         # Arrange
         manager = ClientManager()
         client_id = "nonexistent-client"
         request_id = "req-123"
 
+        # Act & Assert
+        with pytest.raises(ValueError):
+            manager.untrack_request_from_client(client_id, request_id)
+
+    async def test_tracking_tracks_request_for_duration_of_block(self):
+        # Arrange
+        manager = ClientManager()
+        client_id = "test-client-123"
+        request_id = "req-123"
+
+        manager.register_client(client_id)
+
         request = PingRequest()
-        task = asyncio.create_task(asyncio.sleep(0))  # Simple task for testing
+        task = asyncio.create_task(asyncio.sleep(0))
 
         # Act & Assert
-        with pytest.raises(ValueError):
-            manager.track_request_from_client(client_id, request_id, request, task)
+        with manager.tracking(client_id, request_id, request, task):
+            assert manager.get_request_from_client(client_id, request_id) == (
+                request,
+                task,
+            )
+
+        assert manager.get_request_from_client(client_id, request_id) is None
 
         # Cleanup
         task.cancel()
 
-    async def test_untrack_request_from_client(self):
+    async def test_tracking_exits_cleanly_after_client_cleanup(self):
         # Arrange
         manager = ClientManager()
         client_id = "test-client-123"
@@ -356,37 +405,29 @@ class TestInboundRequests:
         manager.register_client(client_id)
 
         request = PingRequest()
-        task = asyncio.create_task(asyncio.sleep(0))
-
-        # Track first, then untrack
-        manager.track_request_from_client(client_id, request_id, request, task)
-        assert manager.get_request_from_client(client_id, request_id) is not None
+        task = asyncio.create_task(asyncio.sleep(10))
 
         # Act
-        result = manager.untrack_request_from_client(client_id, request_id)
+        with manager.tracking(client_id, request_id, request, task):
+            manager.cleanup_client(client_id)
 
         # Assert
-        assert result is not None
-        untracked_request, untracked_task = result
-        assert untracked_request is request
-        assert untracked_task is task
-
-        # Verify it's actually removed from tracking
-        client_state = manager.get_client(client_id)
-        assert request_id not in client_state.requests_from_client
-
-        # Cleanup
-        task.cancel()
+        assert manager.get_client(client_id) is None
+        assert task.cancelling()
 
-    async def test_untrack_request_from_client_raises_for_unregistered_client(self):
+    async def test_tracking_raises_for_unregistered_client(self):
         # Arrange
         manager = ClientManager()
-        client_id = "nonexistent-client"
-        request_id = "req-123"
+        request = PingRequest()
+        task = asyncio.create_task(asyncio.sleep(0))
 
         # Act & Assert
         with pytest.raises(ValueError):
-            manager.untrack_request_from_client(client_id, request_id)
+            with manager.tracking("nonexistent-client", "req-123", request, task):
+                pass
+
+        # Cleanup
+        task.cancel()
 
     async def test_get_request_from_client(self):
         # Arrange
@@ -400,10 +441,9 @@ class TestInboundRequests:
         task = asyncio.create_task(asyncio.sleep(0))
 
         # Track the request first
-        manager.track_request_from_client(client_id, request_id, request, task)
-
-        # Act
-        result = manager.get_request_from_client(client_id, request_id)
+        with manager.tracking(client_id, request_id, request, task):
+            # Act
+            result = manager.get_request_from_client(client_id, request_id)
 
         # Assert
         assert result is not None
@@ -452,24 +492,21 @@ class TestCleanup:
         # Set up inbound request tracking
         inbound_request = PingRequest()
         inbound_task = asyncio.create_task(asyncio.sleep(10))  # Long-running task
-        manager.track_request_from_client(
-            client_id, "inbound-123", inbound_request, inbound_task
-        )
-
-        # Set up outbound request tracking
-        outbound_request = PingRequest()
-        outbound_future = asyncio.Future[Result | Error]()
-        manager.track_request_to_client(
-            client_id, "outbound-456", outbound_request, outbound_future
-        )
-
-        # Verify setup
-        assert manager.get_client(client_id) is not None
-        assert not inbound_task.cancelled()
-        assert not outbound_future.done()
-
-        # Act
-        manager.cleanup_client(client_id)
+        with manager.tracking(client_id, "inbound-123", inbound_request, inbound_task):
+            # Set up outbound request tracking
+            outbound_request = PingRequest()
+            outbound_future = asyncio.Future[Result | Error]()
+            manager.track_request_to_client(
+                client_id, "outbound-456", outbound_request, outbound_future
+            )
+
+            # Verify setup
+            assert manager.get_client(client_id) is not None
+            assert not inbound_task.cancelled()
+            assert not outbound_future.done()
+
+            # Act
+            manager.cleanup_client(client_id)
 
         # Assert
         # Server should be removed from tracking
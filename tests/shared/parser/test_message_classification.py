@@ -0,0 +1,58 @@
+from conduit.shared.message_parser import MessageParser
+
+
+class TestMessageClassification:
+    def test_classifies_valid_messages(self):
+        # Arrange
+        parser = MessageParser()
+        request = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        result_response = {"jsonrpc": "2.0", "id": "abc", "result": {}}
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "error": {"code": -32601, "message": "Method not found"},
+        }
+
+        # Act & Assert
+        assert parser.classify(request) == "request"
+        assert parser.classify(notification) == "notification"
+        assert parser.classify(result_response) == "response"
+        assert parser.classify(error_response) == "response"
+
+    def test_returns_none_for_invalid_messages(self):
+        # Arrange
+        parser = MessageParser()
+        invalid_payloads = [
+            {"jsonrpc": "2.0"},
+            {"jsonrpc": "2.0", "id": None, "method": "ping"},
+            {"jsonrpc": "2.0", "id": True, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 1.5, "result": {}},
+            {"jsonrpc": "2.0", "result": {}},
+            {"jsonrpc": "2.0", "id": 1},
+            {"jsonrpc": "2.0", "id": 1, "result": {}, "error": {}},
+        ]
+
+        # Act & Assert
+        for payload in invalid_payloads:
+            assert parser.classify(payload) is None
+
+    def test_agrees_with_individual_validity_checks(self):
+        # Arrange
+        parser = MessageParser()
+        payloads = [
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "result": {}},
+            {"jsonrpc": "2.0", "id": None, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 3},
+        ]
+
+        for payload in payloads:
+            # Act
+            kind = parser.classify(payload)
+
+            # Assert
+            assert (kind == "request") is parser.is_valid_request(payload)
+            assert (kind == "notification") is parser.is_valid_notification(payload)
+            assert (kind == "response") is parser.is_valid_response(payload)
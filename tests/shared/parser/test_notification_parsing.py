@@ -1,4 +1,7 @@
+import pytest
+
 from conduit.protocol.common import CancelledNotification
+from conduit.protocol.initialization import InitializedNotification
 from conduit.shared.message_parser import MessageParser
 
 
@@ -103,3 +106,50 @@ class TestNotificationParsing:
 
         # Assert
         assert result is None
+
+    def test_paramless_notifications_parse_to_independent_instances(self):
+        # Arrange
+        parser = MessageParser()
+        payload = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+        # Act
+        first = parser.parse_notification(payload)
+        first.metadata = {"mutated": True}
+        second = parser.parse_notification(payload)
+
+        # Assert
+        assert isinstance(second, InitializedNotification)
+        assert second is not first
+        assert second.metadata is None
+
+    @pytest.mark.parametrize("params", [[], "", 0, None])
+    def test_malformed_falsy_params_return_none(self, params):
+        # Arrange
+        parser = MessageParser()
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized",
+            "params": params,
+        }
+
+        # Act
+        result = parser.parse_notification(payload)
+
+        # Assert
+        assert result is None
+
+    def test_notification_with_metadata_is_parsed_fresh(self):
+        # Arrange
+        parser = MessageParser()
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized",
+            "params": {"_meta": {"source": "test"}},
+        }
+
+        # Act
+        result = parser.parse_notification(payload)
+
+        # Assert
+        assert isinstance(result, InitializedNotification)
+        assert result.metadata == {"source": "test"}
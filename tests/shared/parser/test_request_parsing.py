@@ -1,3 +1,5 @@
+import pytest
+
 from conduit.protocol.base import INVALID_PARAMS, METHOD_NOT_FOUND, Error
 from conduit.protocol.common import PingRequest
 from conduit.shared.message_parser import MessageParser
@@ -16,6 +18,35 @@ class TestRequestParsing:
         assert isinstance(result, PingRequest)
         assert result.method == "ping"
 
+    def test_paramless_requests_parse_to_independent_instances(self):
+        # Arrange
+        parser = MessageParser()
+        first_payload = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        second_payload = {"jsonrpc": "2.0", "id": 2, "method": "ping", "params": {}}
+
+        # Act
+        first = parser.parse_request(first_payload)
+        first.metadata = {"mutated": True}
+        second = parser.parse_request(second_payload)
+
+        # Assert
+        assert isinstance(second, PingRequest)
+        assert second is not first
+        assert second.metadata is None
+
+    @pytest.mark.parametrize("params", [[], "", 0, None])
+    def test_malformed_falsy_params_return_invalid_params_error(self, params):
+        # Arrange
+        parser = MessageParser()
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "ping", "params": params}
+
+        # Act
+        result = parser.parse_request(payload)
+
+        # Assert
+        assert isinstance(result, Error)
+        assert result.code == INVALID_PARAMS
+
     def test_unknown_method_returns_method_not_found_error(self):
         # Arrange
         parser = MessageParser()
@@ -0,0 +1,57 @@
+from typing import Any
+
+from conduit.transport.http.server.server_transport import HTTPTransport
+from conduit.transport.server import ClientMessage
+
+
+class ConcreteHTTPTransport(HTTPTransport):
+    """HTTPTransport doesn't implement send yet."""
+
+    async def send(self, client_id: str, message: dict[str, Any]) -> None:
+        await self.send_to_client(client_id, message)
+
+
+def queue_messages(transport: HTTPTransport, count: int) -> list[ClientMessage]:
+    messages = [
+        ClientMessage(
+            client_id="client-1",
+            payload={"jsonrpc": "2.0", "method": "ping", "id": i},
+            timestamp=float(i),
+        )
+        for i in range(count)
+    ]
+    for message in messages:
+        transport._message_queue.put_nowait(message)
+    return messages
+
+
+class TestHTTPClientMessages:
+    """Test HTTP server transport client message iteration."""
+
+    async def test_yields_queued_burst_in_order(self):
+        # Arrange
+        transport = ConcreteHTTPTransport()
+        queued = queue_messages(transport, 3)
+        iterator = transport.client_messages()
+
+        # Act
+        received = [await anext(iterator) for _ in range(3)]
+
+        # Assert
+        assert received == queued
+
+    async def test_close_ends_iteration_mid_drain(self):
+        # Arrange
+        transport = ConcreteHTTPTransport()
+        queued = queue_messages(transport, 3)
+        iterator = transport.client_messages()
+        first = await anext(iterator)
+
+        # Act
+        await transport.close()
+        remaining = [message async for message in iterator]
+
+        # Assert
+        assert first == queued[0]
+        assert remaining == []
+        assert transport._message_queue.qsize() == 2
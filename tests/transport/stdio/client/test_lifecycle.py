@@ -135,8 +135,9 @@ class TestStdioClientLifecycle:
         assert transport.is_open
         assert transport._is_process_alive()
 
-        # Act - wait for process to exit naturally
-        await asyncio.sleep(0.1)
+        # Act - wait for process to exit naturally. Bound the wait rather than
+        # sleeping a fixed time, which is flaky on a loaded machine.
+        await asyncio.wait_for(transport._process.wait(), timeout=5.0)
 
         # Assert - process exit is detected
         assert not transport._is_process_alive()
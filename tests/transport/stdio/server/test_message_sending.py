@@ -0,0 +1,62 @@
+from conduit.transport.stdio.server import StdioServerTransport
+from conduit.transport.stdio.shared import serialize_message
+
+
+class ConcreteStdioServerTransport(StdioServerTransport):
+    """StdioServerTransport doesn't implement disconnect_client yet."""
+
+    async def disconnect_client(self, client_id: str) -> None:
+        pass
+
+
+class TestStdioServerMessageSending:
+    """Test stdio server transport message sending behavior."""
+
+    async def test_send_many_writes_messages_in_order(self, capsys):
+        # Arrange
+        transport = ConcreteStdioServerTransport()
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "result": {}},
+            {"jsonrpc": "2.0", "id": 2, "result": {}},
+        ]
+
+        # Act
+        await transport.send_many("stdio-client", messages)
+
+        # Assert
+        expected = "".join(serialize_message(message) + "\n" for message in messages)
+        assert capsys.readouterr().out == expected
+
+    async def test_send_many_skips_invalid_message_and_writes_the_rest(self, capsys):
+        # Arrange
+        transport = ConcreteStdioServerTransport()
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "result": {}},
+            {"jsonrpc": "2.0", "id": 2, "result": {"bad": object()}},
+            {"jsonrpc": "2.0", "id": 3, "result": {}},
+        ]
+
+        # Act
+        outcomes = await transport.send_many("stdio-client", messages)
+
+        # Assert
+        assert outcomes[0] is None
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] is None
+        expected = serialize_message(messages[0]) + "\n"
+        expected += serialize_message(messages[2]) + "\n"
+        assert capsys.readouterr().out == expected
+
+    async def test_send_many_reports_every_message_when_transport_closed(self, capsys):
+        # Arrange
+        transport = ConcreteStdioServerTransport()
+        transport._is_open = False
+        messages = [{"jsonrpc": "2.0", "id": 1}, {"jsonrpc": "2.0", "id": 2}]
+
+        # Act
+        outcomes = await transport.send_many("stdio-client", messages)
+
+        # Assert
+        assert len(outcomes) == 2
+        assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+        assert capsys.readouterr().out == ""